@@ -2,10 +2,15 @@
 Main content of iolib
 """
 
+import io
 import sys
+import time
+import ctypes
 import msvcrt
 import threading
-from typing import Any, Callable
+from ctypes import wintypes
+from typing import Any, Callable, NamedTuple
+from collections import deque
 from collections.abc import Iterable
 
 
@@ -19,11 +24,6 @@ __all__ = [
 ]
 
 
-# activate ANSI escape codes
-import os as _os
-_os.system("")
-del _os
-
 # constants
 UP = b"H"
 DOWN = b"P"
@@ -32,12 +32,197 @@ LEFT = b"K"
 ENTER = b"\r"
 BACKSPACE = b"\x08"
 SPECIAL = b"\x00"
-IGNORE = [RIGHT, LEFT, b"H", b"P"]
+IGNORE = frozenset((RIGHT, LEFT, b"H", b"P"))
 
 ANSI_UP = "\u001b[A"
 ANSI_DOWN = "\u001b[B"
 ANSI_RIGHT = "\u001b[C"
 ANSI_LEFT = "\u001b[D"
+ANSI_ERASE_LINE = "\u001b[K"  # from cursor to end of line
+_ERASE_LINE_DOWN = "\r" + ANSI_ERASE_LINE + ANSI_DOWN
+
+# lookup table for the input loops
+_CSI_LEFT_N = ("",) + tuple(f"\u001b[{n}D" for n in range(1, 256))  # "\u001b[0D" moves 1
+
+OUT_BUFFER_SIZE = 8192  # used by 'IODisplay' when buffered
+
+# console
+STD_INPUT_HANDLE = -10
+STD_OUTPUT_HANDLE = -11
+ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+INFINITE = 0xFFFFFFFF
+WAIT_OBJECT_0 = 0x00000000
+WAIT_FAILED = 0xFFFFFFFF
+KEY_EVENT = 0x0001
+MAX_EVENTS = 16  # drained per wake
+POLL_INTERVAL = 0.01  # seconds slept between polls, when the console can not be waited on
+
+# virtual key codes
+VK_BACK = 0x08
+VK_RETURN = 0x0D
+VK_LEFT = 0x25
+VK_UP = 0x26
+VK_RIGHT = 0x27
+VK_DOWN = 0x28
+
+# used when falling back to 'msvcrt.getwch'
+_SCAN_TO_VK = {UP.decode(): VK_UP, DOWN.decode(): VK_DOWN,
+               LEFT.decode(): VK_LEFT, RIGHT.decode(): VK_RIGHT}
+_CHAR_TO_VK = {ENTER.decode(): VK_RETURN, BACKSPACE.decode(): VK_BACK}
+
+
+class _KeyEventRecord(ctypes.Structure):
+    _fields_ = [("bKeyDown", wintypes.BOOL),
+                ("wRepeatCount", wintypes.WORD),
+                ("wVirtualKeyCode", wintypes.WORD),
+                ("wVirtualScanCode", wintypes.WORD),
+                ("UnicodeChar", wintypes.WCHAR),
+                ("dwControlKeyState", wintypes.DWORD)]
+
+
+class _EventRecord(ctypes.Union):
+    _fields_ = [("KeyEvent", _KeyEventRecord),
+                ("_size", ctypes.c_byte * 16)]  # largest member, 'MOUSE_EVENT_RECORD'
+
+
+class _InputRecord(ctypes.Structure):
+    _fields_ = [("EventType", wintypes.WORD),
+                ("Event", _EventRecord)]
+
+
+class _KeyEvent(NamedTuple):
+    """Key pressed down, as read from the console"""
+    vk: int  # virtual key code, 0 if unknown
+    char: str  # "" if not producing a character
+
+
+_kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+_kernel32.GetStdHandle.argtypes = [wintypes.DWORD]
+_kernel32.GetStdHandle.restype = wintypes.HANDLE
+_kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+_kernel32.WaitForSingleObject.restype = wintypes.DWORD
+_kernel32.GetNumberOfConsoleInputEvents.argtypes = [wintypes.HANDLE, wintypes.LPDWORD]
+_kernel32.GetNumberOfConsoleInputEvents.restype = wintypes.BOOL
+_kernel32.PeekConsoleInputW.argtypes = [wintypes.HANDLE, ctypes.POINTER(_InputRecord),
+                                        wintypes.DWORD, wintypes.LPDWORD]
+_kernel32.PeekConsoleInputW.restype = wintypes.BOOL
+_kernel32.ReadConsoleInputW.argtypes = [wintypes.HANDLE, ctypes.POINTER(_InputRecord),
+                                        wintypes.DWORD, wintypes.LPDWORD]
+_kernel32.ReadConsoleInputW.restype = wintypes.BOOL
+_kernel32.GetConsoleMode.argtypes = [wintypes.HANDLE, wintypes.LPDWORD]
+_kernel32.GetConsoleMode.restype = wintypes.BOOL
+_kernel32.SetConsoleMode.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+_kernel32.SetConsoleMode.restype = wintypes.BOOL
+
+# activate ANSI escape codes, without spawning a shell like 'os.system("")'
+_handle = _kernel32.GetStdHandle(STD_OUTPUT_HANDLE)
+_mode = wintypes.DWORD()
+if _kernel32.GetConsoleMode(_handle, ctypes.byref(_mode)):  # fails if not a console
+    _kernel32.SetConsoleMode(_handle, _mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING)
+del _handle, _mode
+
+
+def _up(n: int) -> str:
+    """ANSI escape code moving the cursor up 'n' lines, in constant size"""
+    return f"\u001b[{n}A" if n else ""
+
+
+def _down(n: int) -> str:
+    """ANSI escape code moving the cursor down 'n' lines, in constant size"""
+    return f"\u001b[{n}B" if n else ""
+
+
+def _cursor_left(n: int) -> str:
+    """ANSI escape code moving the cursor left 'n' columns, looked up when small"""
+    return _CSI_LEFT_N[n] if n < 256 else f"\u001b[{n}D"
+
+
+def _kbhit_poll(timeout_ms: int = INFINITE) -> bool:
+    """Poll 'msvcrt.kbhit' until a key is ready
+
+    Args:
+        timeout_ms (int, optional): max time to wait in milliseconds. Defaults to INFINITE.
+
+    Returns:
+        bool: whether a key is ready to be read
+    """
+    if timeout_ms == INFINITE:
+        while not msvcrt.kbhit():
+            time.sleep(POLL_INTERVAL)
+        return True
+    deadline = time.monotonic() + timeout_ms / 1000
+    while not msvcrt.kbhit():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(POLL_INTERVAL)
+    return True
+
+
+def _getwch_key_events(timeout_ms: int = INFINITE) -> list:
+    """Fallback for '_read_key_events', reading a single key using 'msvcrt.getwch'
+
+    Args:
+        timeout_ms (int, optional): max time to wait in milliseconds. Defaults to INFINITE.
+
+    Returns:
+        list[_KeyEvent]: the key read, or empty if timed out
+    """
+    if not _kbhit_poll(timeout_ms):
+        return []
+    char = msvcrt.getwch()  # decoded by the console, unlike the bytes of 'getch'
+    # special key, followed by its scan code. "\xe0" is also a typed 'à',
+    # told apart by the scan code already being queued
+    if char == "\x00" or (char == "\xe0" and msvcrt.kbhit()):
+        return [_KeyEvent(_SCAN_TO_VK.get(msvcrt.getwch(), 0), "")]
+    return [_KeyEvent(_CHAR_TO_VK.get(char, 0), char)]
+
+
+def _read_key_events(timeout_ms: int = INFINITE, max_events: int = MAX_EVENTS) -> list:
+    """Block on the console input handle, then drain the pending key presses
+
+    Stops after 'Enter', so keys typed ahead are left for the next reader.
+    Falls back to '_getwch_key_events' if the handle is not a console (like when redirected)
+
+    Args:
+        timeout_ms (int, optional): max time to wait in milliseconds. Defaults to INFINITE.
+        max_events (int, optional): max number of console events read. Defaults to MAX_EVENTS.
+
+    Returns:
+        list[_KeyEvent]: keys pressed, may be empty if timed out or only other events occurred
+    """
+    try:
+        handle = _kernel32.GetStdHandle(STD_INPUT_HANDLE)
+        result = _kernel32.WaitForSingleObject(handle, timeout_ms)
+        if result == WAIT_FAILED:
+            raise ctypes.WinError(ctypes.get_last_error())
+        if result != WAIT_OBJECT_0:  # timed out
+            return []
+        pending = wintypes.DWORD()
+        if not _kernel32.GetNumberOfConsoleInputEvents(handle, ctypes.byref(pending)):
+            raise ctypes.WinError(ctypes.get_last_error())
+        records = (_InputRecord * max(1, min(pending.value, max_events)))()
+        n_read = wintypes.DWORD()
+        if not _kernel32.PeekConsoleInputW(handle, records, len(records), ctypes.byref(n_read)):
+            raise ctypes.WinError(ctypes.get_last_error())
+        events = []
+        n_consumed = n_read.value
+        for i in range(n_read.value):
+            record = records[i]
+            if record.EventType != KEY_EVENT or not record.Event.KeyEvent.bKeyDown:
+                continue  # key release, mouse, focus, ...
+            key = record.Event.KeyEvent
+            char = key.UnicodeChar if key.UnicodeChar != "\x00" else ""
+            events.extend([_KeyEvent(key.wVirtualKeyCode, char)] * max(1, key.wRepeatCount))
+            if key.wVirtualKeyCode == VK_RETURN:
+                n_consumed = i + 1
+                break
+        # remove what was peeked, which is still at the front of the queue
+        if n_consumed and not _kernel32.ReadConsoleInputW(handle, records, n_consumed,
+                                                          ctypes.byref(n_read)):
+            raise ctypes.WinError(ctypes.get_last_error())
+        return events
+    except OSError:
+        return _getwch_key_events(timeout_ms)
 
 
 def selection(*options, active: str = " >", passive: str = "> ", wrap: bool = False) -> Any:
@@ -60,72 +245,69 @@ def selection(*options, active: str = " >", passive: str = "> ", wrap: bool = Fa
     # control variables
     idx = 0
     n_options = len(options)
-    longest_option = len(max(options, key=len))
-    longest_mode = len(max(passive, active, key=len))
-    longest_length = longest_option + longest_mode
-
-    # display options
-    sys.stdout.write(active + str(options[0]))
-    for option in options[1:]:
-        sys.stdout.write("\n" + passive + str(option))
-    sys.stdout.write("\r")
+    options_str = tuple(map(str, options))  # rendered once
+    reset = "\r" + ANSI_ERASE_LINE  # reset line
+
+    # display options, and place cursor at top
+    sys.stdout.write(active + options_str[0]
+                     + "".join("\n" + passive + option for option in options_str[1:])
+                     + "\r" + _up(n_options - 1))
     sys.stdout.flush()
-    # place cursor at top
-    sys.stdout.write(ANSI_UP * (n_options - 1))
+
+    # names used by the loop below, bound as locals to skip global/attribute lookups
+    _VK_RETURN = VK_RETURN
+    _VK_DOWN = VK_DOWN
+    _VK_UP = VK_UP
+    _ANSI_UP = ANSI_UP
+    _ANSI_DOWN = ANSI_DOWN
+    wrap_up = _up(n_options - 1)
+    wrap_down = _down(n_options - 1)
+    write = sys.stdout.write
+    flush = sys.stdout.flush
+    read_key_events = _read_key_events
 
     while True:
-        if msvcrt.kbhit():
-            key = msvcrt.getch()
-            if key == ENTER:
-                sys.stdout.write("\n")
-                sys.stdout.flush()
+        for event in read_key_events():
+            if event.vk == _VK_RETURN:
+                write("\n")
+                flush()
                 return options[idx]
 
-            elif key == DOWN:
+            elif event.vk == _VK_DOWN:
                 current = idx
                 idx += 1
                 idx = min(idx, (n_options - 1))
-                # reset line
-                reset = "\r" + " " * longest_length + "\r"
-                sys.stdout.write(reset)
-                sys.stdout.write(passive + options[current])
-                sys.stdout.write("\r")
+                # redraw previous option as passive
+                buffer = reset + passive + options_str[current] + "\r"
                 # move cursor
                 if idx == current:  # hit end
                     if wrap and n_options > 1:  # wrap around up
                         idx = 0
-                        # move
-                        sys.stdout.write(ANSI_UP * (n_options - 1))
+                        buffer += wrap_up
                 else:  # move one line
-                    sys.stdout.write(ANSI_DOWN)
+                    buffer += _ANSI_DOWN
                 # display current option
-                content = active + options[idx]
-                sys.stdout.write(content)
-                sys.stdout.write("\r")
-                sys.stdout.flush()
+                buffer += reset + active + options_str[idx] + "\r"
+                write(buffer)
+                flush()
 
-            elif key == UP:
+            elif event.vk == _VK_UP:
                 current = idx
                 idx -= 1
                 idx = max(idx, 0)
-                # reset line
-                reset = "\r" + " " * longest_length + "\r"
-                sys.stdout.write(reset)
-                sys.stdout.write(passive + options[current])
-                sys.stdout.write("\r")
+                # redraw previous option as passive
+                buffer = reset + passive + options_str[current] + "\r"
                 # move cursor
                 if idx == current:  # hit end
-                    if wrap and n_options > 1:  # wrap around up
+                    if wrap and n_options > 1:  # wrap around down
                         idx = (n_options - 1)
-                        # move
-                        sys.stdout.write(ANSI_DOWN * (n_options - 1))
+                        buffer += wrap_down
                 else:  # move one line
-                    sys.stdout.write(ANSI_UP)
+                    buffer += _ANSI_UP
                 # display current option
-                content = active + options[idx]
-                sys.stdout.write(content)
-                sys.stdout.write("\r")
-                sys.stdout.flush()
+                buffer += reset + active + options_str[idx] + "\r"
+                write(buffer)
+                flush()
 
 
 def input_write(prompt: Any = "", edit: Any = "", /) -> str:
@@ -139,76 +321,65 @@ def input_write(prompt: Any = "", edit: Any = "", /) -> str:
         str: written string
     """
     sys.stdout.write(prompt + edit)
-    written = list(edit)
-    curr = len(edit)
-    last_key = ""  # support for uppercase letter 'M', 'K, 'H' and 'P'
-
-    # local constants
-    RIGHT = b"M"
-    LEFT = b"K"
-    ENTER = b"\r"
-    BACKSPACE = b"\x08"
-    SPECIAL = b"\x00"
-    # does not write to 'sys.stdout' when 'IGNORE' is recieved right before (special char)
-    IGNORE = [RIGHT, LEFT, b"H", b"P"]
+    sys.stdout.flush()  # show prompt before blocking
+    # gap buffer: cursor sits between 'left' and 'right' ('right' is reversed)
+    left = list(edit)
+    right = []
+    right_str = ""  # cached rendered 'right'
+
+    # locals for the loop, as in 'selection'
+    _VK_RETURN = VK_RETURN
+    _VK_RIGHT = VK_RIGHT
+    _VK_LEFT = VK_LEFT
+    _VK_BACK = VK_BACK
+    write = sys.stdout.write
+    flush = sys.stdout.flush
+    read_key_events = _read_key_events
+    cursor_left = _cursor_left
+    _ANSI_RIGHT = ANSI_RIGHT
+    _ANSI_LEFT = ANSI_LEFT
 
     while True:
-        if msvcrt.kbhit():
-            key = msvcrt.getch()
-            # use copy of 'last_key' later (next iteration)
-            last_key_copy = last_key
-            last_key = key  # store key for later use
-            if key == ENTER:
+        for event in read_key_events():
+            if event.vk == _VK_RETURN:
                 # cleanup
-                sys.stdout.write("\n")
-                sys.stdout.flush()
+                write("\n")
+                flush()
                 # return as string
-                return "".join(written)
-
-            elif key == RIGHT and last_key_copy == SPECIAL:
-                if curr < len(written):
-                    sys.stdout.write("\u001b[C")
-                    curr += 1
-
-            elif key == LEFT and last_key_copy == SPECIAL:
-                if curr > 0:
-                    curr -= 1
-                    sys.stdout.write("\u001b[D")
-
-            elif key == BACKSPACE:
-                if written:  # if has content
-                    if curr <= 0:  # if focus is to max left
-                        continue
+                return "".join(left) + right_str
+
+            elif event.vk == _VK_RIGHT:
+                if right:
+                    write(_ANSI_RIGHT)
+                    flush()
+                    left.append(right.pop())
+                    right_str = right_str[1:]
+
+            elif event.vk == _VK_LEFT:
+                if left:
+                    letter = left.pop()
+                    right.append(letter)
+                    right_str = letter + right_str
+                    write(_ANSI_LEFT)
+                    flush()
+
+            elif event.vk == _VK_BACK:
+                if left:  # if has content left of focus
                     # remove last char
-                    size = len(written)
-                    rest = "".join(written[curr:size])
-                    n = len(rest) + 1
-                    sys.stdout.write("\u001b[D")
-                    sys.stdout.write(rest + " ")
-                    # move focus right n times to cleanup
-                    sys.stdout.write(f"\u001b[{n}D")
-                    curr -= 1  # decrement
-                    written.pop(curr)  # remove current
-
-            else:
-                # adds support for uppercase letter 'M', 'K, 'H' and 'P'
-                if key == SPECIAL:
-                    continue
-                elif key in IGNORE:
-                    if last_key_copy == SPECIAL:
-                        continue
+                    left.pop()
+                    # step back, redraw rest and move focus left to cleanup
+                    buffer = _ANSI_LEFT + right_str + " " + cursor_left(len(right_str) + 1)
+                    write(buffer)
+                    flush()
+
+            elif event.char:
                 # write letter
-                letter = key.decode()
-                written.insert(curr, letter)  # add to written
-                sys.stdout.write(letter)
-                curr += 1  # increment
-                size = len(written)
-                rest = "".join(written[curr:size])
-                sys.stdout.write(rest)
-                # move focus left n times to cleanup
-                n = size - curr
-                if n > 0:  # to prevent when n == 0
-                    sys.stdout.write(f"\u001b[{n}D")  # f-string
+                letter = event.char
+                left.append(letter)  # add to written
+                # move focus left to cleanup
+                buffer = letter + right_str + cursor_left(len(right))
+                write(buffer)
+                flush()
 
 
 def input_hidden(prompt: Any = "", /) -> str:
@@ -223,40 +394,31 @@ def input_hidden(prompt: Any = "", /) -> str:
         str: written string
     """
     sys.stdout.write(prompt)
+    sys.stdout.flush()  # show prompt before blocking
     written = []
-    last_key = ""
 
-    # local contants
-    ENTER = b"\r"
-    BACKSPACE = b"\x08"
-    SPECIAL = b"\x00"
-    # does not append to 'written' when 'IGNORE' is recieved right before (special char)
-    IGNORE = [b"M", b"K", b"H", b"P"]
+    # locals for the loop, as in 'selection'
+    _VK_RETURN = VK_RETURN
+    _VK_BACK = VK_BACK
+    write = sys.stdout.write
+    flush = sys.stdout.flush
+    read_key_events = _read_key_events
 
     while True:
-        if msvcrt.kbhit():
-            key = msvcrt.getch()
-            last_key_copy = last_key  # use copy of 'last_key' later
-            last_key = key  # store key for later use (next iteration)
-            if key == ENTER:
+        for event in read_key_events():
+            if event.vk == _VK_RETURN:
                 # cleanup
-                sys.stdout.write("\n")
-                sys.stdout.flush()
+                write("\n")
+                flush()
                 return "".join(written)  # return as string
 
-            elif key == BACKSPACE:
+            elif event.vk == _VK_BACK:
                 if written:  # remove last letter if not empty
                     written.pop()
 
-            else:  # adds support for uppercase letter 'M', 'K, 'H' and 'P'
-                if key == SPECIAL:
-                    continue
-                elif key in IGNORE:
-                    if last_key_copy == SPECIAL:
-                        continue
+            elif event.char:
                 # store letter
-                letter = key.decode()
-                written.append(letter)
+                written.append(event.char)
 
 
 class IODisplay:
@@ -264,21 +426,51 @@ class IODisplay:
     TODO: add event system for flush protection
     """
 
-    def __init__(self, prompt: str = "", /, lines: int = 4, *, dispatch_on_enter: bool = True):
+    __slots__ = ("prompt", "lines", "callback", "dispatch_on_enter", "_running",
+                 "_left", "_right", "_right_str", "_regestry", "_thread", "_out",
+                 "_flush_frames")
+
+    def __init__(self, prompt: str = "", /, lines: int = 4, *,
+                 dispatch_on_enter: bool = True, buffered: bool = False):
         """Innit an IODisplay
 
         Args:
             prompt (str, optional): prompt presented to the user. Defaults to "".
             lines (int, optional): number of lines buffered. Defaults to 4.
+            buffered (bool, optional): whether to write through an explicit buffer,
+                flushed once per frame. Falls back to unbuffered when 'sys.stdout'
+                has no file descriptor. Defaults to False.
+
+        NOTE: frames are only flushed when writing to a tty, buffered or not.
+        When piped, output is flushed on keypresses and 'stop'
         """
         self.prompt = prompt
         self.lines = lines
         self.callback = None
         self.dispatch_on_enter = dispatch_on_enter
         self._running = False
-        self._written = []  # currently typed (as list)
-        self._regestry = ["" for _ in range(lines)]  # filled regestry
+        # currently typed, as gap buffer: cursor sits between '_left' and '_right'
+        self._left = []
+        self._right = []  # reversed
+        self._right_str = ""  # cached rendered '_right'
+        self._regestry = deque(("" for _ in range(lines)), maxlen=lines)  # filled regestry
         self._thread = None
+        self._out = sys.stdout
+        if buffered:
+            try:
+                fd = sys.stdout.fileno()
+            except (AttributeError, OSError, ValueError):  # like 'io.StringIO', IDLE or Jupyter
+                fd = None
+            if fd is not None:
+                sys.stdout.flush()  # keep previous output in order
+                raw = open(fd, "wb", buffering=0, closefd=False)
+                self._out = io.TextIOWrapper(io.BufferedWriter(raw, buffer_size=OUT_BUFFER_SIZE),
+                                             encoding=sys.stdout.encoding,
+                                             errors=sys.stdout.errors,
+                                             write_through=False,
+                                             line_buffering=False)
+        # skip per-frame flushes when piped
+        self._flush_frames = getattr(self._out, "isatty", lambda: False)()
 
     def start(self, *, threaded: bool = True, callback: Callable = None) -> None:
         """Start the IODisplay instance
@@ -303,76 +495,73 @@ class IODisplay:
         self._running = True
         # display lines and prompt
         self._render_lines(init=True)
-        # keyboard info
-        curr = 0
-        last_key = ""  # support for uppercase letter 'M', 'K, 'H' and 'P'
+
+        # locals for the loop, as in 'selection'. '_left' and '_right' are only
+        # ever mutated in place, while '_right_str' is rebound and stays an attribute
+        _VK_RETURN = VK_RETURN
+        _VK_RIGHT = VK_RIGHT
+        _VK_LEFT = VK_LEFT
+        _VK_BACK = VK_BACK
+        write = self._out.write
+        flush = self._out.flush
+        read_key_events = _read_key_events
+        cursor_left = _cursor_left
+        _ANSI_RIGHT = ANSI_RIGHT
+        _ANSI_LEFT = ANSI_LEFT
+        left = self._left
+        right = self._right
 
         while self._running:
-            if msvcrt.kbhit():
-                key = msvcrt.getch()
-                # use copy of 'last_key' later (next iteration)
-                last_key_copy = last_key
-                last_key = key  # store key for later use
-                if key == ENTER:
+            # timeout to observe stop requests
+            for event in read_key_events(50):
+                if event.vk == _VK_RETURN:
                     # 'get' also flushes when 'dispatch=True'
-                    if curr != 0:
-                        sys.stdout.write(ANSI_LEFT * curr)
+                    if left:
+                        write(cursor_left(len(left)))
                     string = self.get(dispatch=self.dispatch_on_enter)
+                    if not self.dispatch_on_enter:  # focus is now at start, so is the gap
+                        left.clear()
+                        right[:] = reversed(string)
+                        self._right_str = string
                     # call callback with currently written string
                     if self.callback != None:
                         self.callback(string)
-                    # reset states
-                    curr = 0
-                    last_key = ""
-
-                elif key == RIGHT and last_key_copy == SPECIAL:
-                    if curr < len(self._written):
-                        sys.stdout.write("\u001b[C")
-                        curr += 1
-                        sys.stdout.flush()
-
-                elif key == LEFT and last_key_copy == SPECIAL:
-                    if curr > 0:
-                        curr -= 1
-                        sys.stdout.write("\u001b[D")
-                        sys.stdout.flush()
-
-                elif key == BACKSPACE:
-                    if self._written:  # if has content
-                        if curr <= 0:  # if focus is to max left
-                            continue
+
+                elif event.vk == _VK_RIGHT:
+                    if right:
+                        write(_ANSI_RIGHT)
+                        left.append(right.pop())
+                        self._right_str = self._right_str[1:]
+                        flush()
+
+                elif event.vk == _VK_LEFT:
+                    if left:
+                        letter = left.pop()
+                        right.append(letter)
+                        self._right_str = letter + self._right_str
+                        write(_ANSI_LEFT)
+                        flush()
+
+                elif event.vk == _VK_BACK:
+                    if left:  # if has content left of focus
                         # remove last char
-                        size = len(self._written)
-                        rest = "".join(self._written[curr:size])
-                        sys.stdout.write("\u001b[D")
-                        sys.stdout.write(rest + " ")
-                        # move focus right n times to cleanup
-                        n = len(rest) + 1
-                        sys.stdout.write(f"\u001b[{n}D")
-                        curr = max(0, curr - 1)  # decrement
-                        self._written.pop(curr)  # remove current
-                        sys.stdout.flush()
-
-                else:
-                    # adds support for uppercase letter 'M', 'K, 'H' and 'P'
-                    if key == SPECIAL:
-                        continue
-                    elif key in IGNORE:
-                        if last_key_copy == SPECIAL:
-                            continue
+                        left.pop()
+                        # step back, redraw rest and move focus left to cleanup
+                        right_str = self._right_str
+                        buffer = (_ANSI_LEFT + right_str + " "
+                                  + cursor_left(len(right_str) + 1))
+                        write(buffer)
+                        flush()
+
+                elif event.char:
                     # write letter
-                    letter = key.decode()
-                    self._written.insert(curr, letter)  # add to written
-                    sys.stdout.write(letter)
-                    curr += 1  # increment
-                    size = len(self._written)
-                    rest = "".join(self._written[curr:size])
-                    sys.stdout.write(rest)
-                    # move focus left n times to cleanup
-                    n = size - curr
-                    if n > 0:  # to prevent when n == 0
-                        sys.stdout.write(f"\u001b[{n}D")  # f-string
-                    sys.stdout.flush()
+                    letter = event.char
+                    left.append(letter)  # add to written
+                    # move focus left to cleanup
+                    right_str = self._right_str
+                    buffer = letter + right_str + cursor_left(len(right_str))
+                    write(buffer)
+                    flush()
 
     def stop(self, *, dispatch: bool = True) -> None:
         """Stops the IODisplay instance
@@ -385,7 +574,7 @@ class IODisplay:
             self._thread = None
         if dispatch:
             self._clear_lines()
-            sys.stdout.flush()
+        self._out.flush()  # also empties the buffer of 'buffered'
 
     def push(self, o: Any, /, *, flush: bool = True) -> None:
         """Push a new object to the fixed size regestry
@@ -395,12 +584,11 @@ class IODisplay:
             update (bool, optional): whether to flush changes. Defaults to True.
         """
         self._clear_lines()
+        # 'maxlen' of the regestry cuts out front
         if isinstance(o, Iterable) and (not isinstance(o, str)):
             self._regestry.extend(map(str, o))
-            self._regestry = self._regestry[len(o):]  # cut out front
         else:
             self._regestry.append(str(o))
-            _first_element = self._regestry.pop(0)  # pop front
         if flush:
             self._render_lines()
 
@@ -411,7 +599,8 @@ class IODisplay:
             flush (bool, optional): whether to flush changes. Defaults to True.
         """
         self._clear_lines(flush=(not flush))
-        self._regestry = ["" for _ in range(self.lines)]
+        self._regestry.clear()
+        self._regestry.extend("" for _ in range(self.lines))
         if flush:
             self._render_lines()
 
@@ -424,14 +613,15 @@ class IODisplay:
         Returns:
             str: currently written string
         """
-        string = "".join(self._written)
+        string = "".join(self._left) + self._right_str
         if dispatch:
-            if self._written != []:
-                reset = (" " * len(self._written)
-                         + ANSI_LEFT * len(self._written))
-                sys.stdout.write(reset)
-                self._written = []
-                sys.stdout.flush()
+            if string:
+                reset = " " * len(string) + _cursor_left(len(string))
+                self._out.write(reset)
+                self._left.clear()
+                self._right.clear()
+                self._right_str = ""
+                self._out.flush()
         return string
 
     def _clear_lines(self, flush: bool = False) -> None:
@@ -440,15 +630,10 @@ class IODisplay:
         Args:
             flush (bool, optional): whether to flush. Defaults to False.
         """
-        buffer = ""
-        buffer += ANSI_UP * (self.lines) + "\r"
-        for element in self._regestry:
-            reset = " " * len(element) + "\r"
-            buffer += reset
-            buffer += ANSI_DOWN
-        sys.stdout.write(buffer)
+        # go to the top line, then erase every line on the way back down
+        self._out.write(_up(self.lines) + _ERASE_LINE_DOWN * len(self._regestry))
         if flush:
-            sys.stdout.flush()
+            self._out.flush()
 
     def _render_lines(self, *, init: bool = False) -> None:
         """Render content
@@ -457,11 +642,12 @@ class IODisplay:
             init (bool, optional): whether to treat as initial call. Defaults to False.
         """
         if not init:
-            sys.stdout.write(ANSI_UP * (self.lines) + "\r")
-        content = "\n".join(self._regestry
-                            + [self.prompt + self.get(dispatch=False)])
-        sys.stdout.write(content)
-        sys.stdout.flush()
+            self._out.write(_up(self.lines) + "\r")
+        content = "\n".join([*self._regestry,
+                              self.prompt + self.get(dispatch=False)])
+        self._out.write(content)
+        if self._flush_frames:
+            self._out.flush()
 
 
 class OverloadUnmatched(TypeError):
@@ -490,21 +676,25 @@ class overload():
     >>>f("2", "3") -> 23
     """
 
-    _uniques = {}
+    __slots__ = ("fn", "fn_name", "fn_signature", "_table")
+    _registry = {}  # one instance per function name, shared by its overloads
+
+    def __new__(cls, function):
+        self = cls._registry.get(function.__name__)
+        if self is None:  # make new
+            self = super().__new__(cls)
+            self._table = {}  # signature -> function
+            cls._registry[function.__name__] = self
+        return self  # python calls '__init__' on it, adding to old
 
     def __init__(self, function):
         self.fn = function
         self.fn_name = function.__name__
-        self.fn_signature = list(function.__annotations__.values())
-        if "return" in function.__annotations__.keys():
-            self.fn_signature.pop()  # remove return type from signature
-
-        if self.fn_name in overload._uniques.keys():
-            overload._uniques[
-                self.fn_name][str(self.fn_signature)] = self.fn  # add to old
-        else:
-            overload._uniques[
-                self.fn_name] = {str(self.fn_signature): self.fn}  # make new
+        # return type is not part of the signature, wherever it is annotated
+        self.fn_signature = tuple(v for k, v in function.__annotations__.items()
+                                  if k != "return")
+        # keyed by tuple of types, so dispatch hashes types instead of strings
+        self._table[self.fn_signature] = self.fn
 
     def __repr__(self):
         return self.fn.__repr__()
@@ -513,12 +703,11 @@ class overload():
         return self.fn.__str__()
 
     def __call__(self, *args, **kwargs):
-        types = [str(type(arg)) for arg in (args + tuple(kwargs.values()))]
-        signature = "[" + ", ".join(types) + "]"
-        if not signature in overload._uniques[self.fn_name].keys():
+        signature = tuple(map(type, args)) + tuple(map(type, kwargs.values()))
+        func = self._table.get(signature)
+        if func is None:
             # no match
-            raise OverloadUnmatched(self.fn_name, signature[1:-1])
-        func = overload._uniques[self.fn_name][signature]
+            raise OverloadUnmatched(self.fn_name, ", ".join(map(str, signature)))
         return func(*args, **kwargs)
 
 